@@ -4,6 +4,10 @@ import pytz
 from pymongo import MongoClient
 from dotenv import load_dotenv
 import google.generativeai as genai
+from google.api_core.exceptions import ResourceExhausted
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import threading
 import time
 
 # Load environment variables
@@ -19,26 +23,63 @@ events_collection = db.events
 genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
 model = genai.GenerativeModel("gemini-1.5-flash")
 
-def generate_event_description(event_name, category):
-    """Generate an accurate description for an event using Gemini."""
-    try:
-        prompt = f"""Please provide a concise, accurate, and culturally sensitive description of the {event_name}, which is a {category} observance. 
+# Number of Gemini requests kept in flight at once (lower it to respect stricter rate limits)
+MAX_CONCURRENT_REQUESTS = int(os.getenv('GEMINI_MAX_CONCURRENCY', '4'))
+
+# Minimum gap in seconds between Gemini requests across all workers, so the pool
+# never exceeds the old one-request-every-2s pace that kept free-tier keys in quota
+MIN_REQUEST_INTERVAL = float(os.getenv('GEMINI_MIN_INTERVAL', '2'))
+request_lock = threading.Lock()
+next_request_at = 0.0
+
+# Built once; only the event name and category vary per call
+EVENT_PROMPT = """Please provide a concise, accurate, and culturally sensitive description of the {event_name}, which is a {category} observance. 
         Include its significance, common practices, and any important historical context.
         Focus on being informative while respecting the religious/cultural significance.
         Keep the description to a single sentence.
         You should also refrain from mentioning the date that the event is observed on.
         
         Your response should be direct, factual, and avoid any speculative language."""
+
+# Sampling settings shared by every request
+GENERATION_CONFIG = genai.types.GenerationConfig(
+    temperature=0.2,
+    top_p=0.8,
+    top_k=40,
+    max_output_tokens=300,
+)
+
+def wait_for_request_slot():
+    """Block until this worker may send the next Gemini request."""
+    global next_request_at
+    with request_lock:
+        now = time.monotonic()
+        delay = next_request_at - now
+        next_request_at = max(now, next_request_at) + MIN_REQUEST_INTERVAL
+    if delay > 0:
+        time.sleep(delay)
+
+# Back off and retry when Gemini answers 429 instead of dropping the event
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=2, min=4, max=60),
+    retry=retry_if_exception_type(ResourceExhausted),
+    reraise=True
+)
+def request_description(prompt):
+    """Send one rate-limited request to Gemini."""
+    wait_for_request_slot()
+    return model.generate_content(
+        prompt,
+        generation_config=GENERATION_CONFIG
+    )
+
+def generate_event_description(event_name, category):
+    """Generate an accurate description for an event using Gemini."""
+    try:
+        prompt = EVENT_PROMPT.format(event_name=event_name, category=category)
         
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.2,
-                top_p=0.8,
-                top_k=40,
-                max_output_tokens=300,
-            )
-        )
+        response = request_description(prompt)
         
         return response.text.strip()
     
@@ -48,18 +89,25 @@ def generate_event_description(event_name, category):
 
 def update_event_entries():
     """Update all events with descriptions."""
-    events = events_collection.find({
-        "concise_details": {"$exists": False}
-    })    
-    for event in events:
-        event_name = event["name"]
-        category = event["category"]
-        print(f"\nProcessing: {event_name}")
-        
-        # Generate description if not present
-        if "concise_details" not in event or "description" not in event.get("concise_details", {}):
-            print("Generating description...")
-            description = generate_event_description(event_name, category)
+    # Only events still missing a description, and only the fields the prompt needs
+    events = list(events_collection.find(
+        {"concise_details": {"$exists": False}},
+        {"name": 1, "category": 1}
+    ))
+    print(f"Generating descriptions for {len(events)} events...")
+    
+    # Overlap the Gemini round-trips instead of waiting on each one in turn
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        futures = {
+            executor.submit(generate_event_description, event["name"], event["category"]): event
+            for event in events
+        }
+        for future in as_completed(futures):
+            event = futures[future]
+            event_name = event["name"]
+            print(f"\nProcessing: {event_name}")
+            
+            description = future.result()
             if description:
                 events_collection.update_one(
                     {"_id": event["_id"]},
@@ -71,11 +119,6 @@ def update_event_entries():
                     }
                 )
                 print("Description added successfully!")
-        else:
-            print("Description already exists, skipping...")
-        
-        # Add delay to respect API rate limits
-        time.sleep(2)
 
 def main():
     """Main execution function."""
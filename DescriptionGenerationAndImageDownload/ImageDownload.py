@@ -4,10 +4,12 @@ import pytz
 from pymongo import MongoClient
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image
 from io import BytesIO
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -38,6 +40,28 @@ IMAGE_SAVE_PATH = os.getenv('IMAGE_SAVE_PATH', r"C:\Users\Arnav\Desktop\Code\EDI
 if not MONGODB_URI:
     raise ValueError("MONGODB_URI not found in environment variables")
 
+# Lookup tables shared by every event, built once instead of per call
+RELIGIOUS_CATEGORY_TERMS = ('religion', 'faith', 'holy', 'sacred')
+RELIGIOUS_EVENT_TERMS = RELIGIOUS_CATEGORY_TERMS + ('spiritual', 'bahá\'í')
+ALLOWED_IMAGE_TYPES = ('image/jpeg', 'image/png', 'image/webp')
+MIN_IMAGE_BYTES = 5 * 1024  # 5KB
+MAX_IMAGE_BYTES = 20 * 1024 * 1024  # 20MB
+# Candidate image URLs are downloaded and validated in parallel
+IMAGE_CHECK_WORKERS = 5
+IMAGE_CHECK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.google.com/'
+}
+
+# Shared session so image checks and downloads reuse keep-alive connections;
+# each host pool holds enough connections for every parallel image check
+http_session = requests.Session()
+http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=IMAGE_CHECK_WORKERS)
+http_session.mount('https://', http_adapter)
+http_session.mount('http://', http_adapter)
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def connect_to_mongodb():
     """Connect to MongoDB with retry logic."""
@@ -81,37 +105,65 @@ def setup_selenium():
         logger.error(f"Error setting up Chrome WebDriver: {e}")
         raise
 
+# One browser shared by every Google search; started on first use and
+# restarted after a crash
+shared_driver = None
+
+def get_shared_driver():
+    """Return the shared Chrome driver, starting it if needed."""
+    global shared_driver
+    if shared_driver is None:
+        shared_driver = setup_selenium()
+    return shared_driver
+
+def close_shared_driver():
+    """Quit the shared Chrome driver so the next search starts a fresh one."""
+    global shared_driver
+    if shared_driver is not None:
+        try:
+            shared_driver.quit()
+            logger.info("Browser closed successfully")
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+        shared_driver = None
+
 def check_image_url(url, is_religious_event=False):
     """Verify if URL points to a suitable image with improved error handling."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': 'https://www.google.com/'
-        }
+        headers = IMAGE_CHECK_HEADERS
         
         # First just check if URL is accessible
-        response = requests.head(url, headers=headers, timeout=5)
+        response = http_session.head(url, headers=headers, timeout=5)
         if response.status_code != 200:
             logger.debug(f"URL not accessible: {url[:100]}")
             return False
+        
+        # Reject on the HEAD headers when they already rule the image out,
+        # so the full body is only downloaded for plausible candidates
+        head_type = response.headers.get('Content-Type', '').lower()
+        if head_type and not any(img_type in head_type for img_type in ALLOWED_IMAGE_TYPES):
+            logger.debug(f"Invalid content type: {head_type}")
+            return False
+        head_length = response.headers.get('Content-Length', '')
+        if head_length.isdigit() and not MIN_IMAGE_BYTES <= int(head_length) <= MAX_IMAGE_BYTES:
+            logger.debug(f"Image size out of range: {head_length} bytes")
+            return False
             
         # Then get the actual image
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_session.get(url, headers=headers, timeout=10)
         
         # Check content type
         content_type = response.headers.get('Content-Type', '').lower()
-        if not any(img_type in content_type for img_type in ['image/jpeg', 'image/png', 'image/webp']):
+        if not any(img_type in content_type for img_type in ALLOWED_IMAGE_TYPES):
             logger.debug(f"Invalid content type: {content_type}")
             return False
             
         # Check file size (between 5KB and 20MB)
         file_size = len(response.content)
-        if file_size < 5 * 1024:  # 5KB
+        if file_size < MIN_IMAGE_BYTES:
             logger.debug(f"Image too small: {file_size} bytes")
             return False
-        if file_size > 20 * 1024 * 1024:  # 20MB
+        if file_size > MAX_IMAGE_BYTES:
             logger.debug(f"Image too large: {file_size} bytes")
             return False
             
@@ -145,15 +197,37 @@ def check_image_url(url, is_religious_event=False):
         logger.debug(f"Error checking image URL: {e}")
         return False
 
+def find_first_valid_image(image_urls, is_religious_event=False):
+    """Check candidate URLs in parallel and return the first valid one in the original order."""
+    if not image_urls:
+        return None
+    
+    executor = ThreadPoolExecutor(max_workers=IMAGE_CHECK_WORKERS)
+    try:
+        futures = [executor.submit(check_image_url, img_url, is_religious_event) for img_url in image_urls]
+        for img_url, future in zip(image_urls, futures):
+            try:
+                logger.info(f"Checking image URL: {img_url[:100]}...")
+                if future.result():
+                    return img_url
+            except Exception as e:
+                logger.error(f"Error checking image URL {img_url[:100]}: {e}")
+                continue
+        return None
+    finally:
+        # Drop checks that have not started once a winner is known
+        executor.shutdown(wait=False, cancel_futures=True)
+
 def generate_search_variations(event_name, category):
     """Generate different search variations for religious/cultural events."""
     variations = [
         event_name,  # Original name
         f"{category} {event_name}",  # Category + name
     ]
+    category_lower = category.lower()
     
     # For Bahá'í specific events
-    if "bahá'í" in category.lower():
+    if "bahá'í" in category_lower:
         variations.extend([
             f"Bahá'í {event_name}",
             "Shrine of Bahá'u'lláh",  # Relevant landmark
@@ -168,7 +242,7 @@ def generate_search_variations(event_name, category):
             variations.append(clean_name)
     
     # For religious events in general
-    if any(term in category.lower() for term in ['religion', 'faith', 'holy', 'sacred']):
+    if any(term in category_lower for term in RELIGIOUS_CATEGORY_TERMS):
         variations.extend([
             f"holy day {event_name}",
             f"religious observance {event_name}",
@@ -186,13 +260,12 @@ def generate_search_variations(event_name, category):
 )
 def search_google_images(query, is_religious_event=False):
     """Search for images using Google Image Search with a simplified, reliable approach."""
-    driver = None
     try:
         search_query = quote(f"{query}")
         url = f"https://images.google.ca/search?q={search_query}&tbm=isch"
         
         logger.info(f"Initializing Google Image search for: {query}")
-        driver = setup_selenium()
+        driver = get_shared_driver()
         
         logger.info("Navigating to Google Images...")
         driver.get(url)
@@ -222,28 +295,20 @@ def search_google_images(query, is_religious_event=False):
                 
         logger.info(f"Found {len(valid_images)} valid image URLs")
         
-        # Try each valid image URL
-        for img_url in valid_images[:10]:  # Try first 10 valid images
-            try:
-                logger.info(f"Checking image URL: {img_url[:100]}...")
-                if check_image_url(img_url, is_religious_event):
-                    return img_url
-            except Exception as e:
-                logger.error(f"Error checking image URL {img_url[:100]}: {e}")
-                continue
-        
-        return None
+        # Try the first 10 valid image URLs, checked concurrently
+        return find_first_valid_image(valid_images[:10], is_religious_event)
         
+    except TimeoutException:
+        logger.error(f"Google Image search timed out for: {query}")
+        raise
+    except WebDriverException as e:
+        # The browser may have crashed; drop it so the retry starts a fresh one
+        logger.error(f"Browser error during Google Image search: {str(e)}")
+        close_shared_driver()
+        raise
     except Exception as e:
         logger.error(f"Error during Google Image search: {str(e)}")
         return None
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("Browser closed successfully")
-            except Exception as e:
-                logger.error(f"Error closing browser: {e}")
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def search_wikimedia_commons(query, is_religious_event=False):
@@ -254,46 +319,40 @@ def search_wikimedia_commons(query, is_religious_event=False):
             'User-Agent': 'EDIProjectImageDownloader/1.0 (educational project) Python/3.x'
         }
         
-        # First try with the exact name
+        # Search the File namespace and fetch each hit's image URL in the same request
         params = {
             "action": "query",
             "format": "json",
-            "list": "search",
-            "srnamespace": "6",  # File namespace
-            "srlimit": "5",  # Increased limit for better chances
-            "srsearch": f'"{query}" filetype:bitmap'
+            "generator": "search",
+            "gsrnamespace": "6",  # File namespace
+            "gsrlimit": "5",  # Increased limit for better chances
+            "gsrsearch": f'"{query}" filetype:bitmap',
+            "prop": "imageinfo",
+            "iiprop": "url"
         }
         
-        response = requests.get(base_url, params=params, headers=headers)
+        # First try with the exact name
+        response = http_session.get(base_url, params=params, headers=headers)
         data = response.json()
         
         # If no results, try a more general search
-        if not data.get("query", {}).get("search"):
-            params["srsearch"] = f"{query} filetype:bitmap"
-            response = requests.get(base_url, params=params, headers=headers)
+        if not data.get("query", {}).get("pages"):
+            params["gsrsearch"] = f"{query} filetype:bitmap"
+            response = http_session.get(base_url, params=params, headers=headers)
             data = response.json()
         
-        if "query" in data and data["query"]["search"]:
+        pages = data.get("query", {}).get("pages")
+        if pages:
+            # Pages come back keyed by id; "index" preserves the search ranking
+            ranked_pages = sorted(pages.values(), key=lambda page: page.get("index", 0))
+            image_urls = [
+                page["imageinfo"][0]["url"]
+                for page in ranked_pages
+                if page.get("imageinfo")
+            ]
+            
             # Try each result until we find a suitable image
-            for result in data["query"]["search"]:
-                file_title = result["title"].replace('File:', '')
-                file_params = {
-                    "action": "query",
-                    "format": "json",
-                    "prop": "imageinfo",
-                    "titles": f"File:{file_title}",
-                    "iiprop": "url"
-                }
-                
-                file_response = requests.get(base_url, params=file_params, headers=headers)
-                file_data = file_response.json()
-                
-                pages = file_data["query"]["pages"]
-                page_id = next(iter(pages))
-                image_url = pages[page_id]["imageinfo"][0]["url"]
-                
-                if check_image_url(image_url, is_religious_event):
-                    return image_url
+            return find_first_valid_image(image_urls, is_religious_event)
         
         return None
             
@@ -318,7 +377,7 @@ def download_and_process_image(url, image_path):
         headers = {
             'User-Agent': 'EDIProjectImageDownloader/1.0 (educational project) Python/3.x'
         }
-        response = requests.get(url, headers=headers)
+        response = http_session.get(url, headers=headers)
         response.raise_for_status()
             
         img = Image.open(BytesIO(response.content))
@@ -339,6 +398,8 @@ def download_and_process_image(url, image_path):
 
 def update_event_images():
     """Download images for all events."""
+    # Google search is skipped for the rest of the run if Chrome cannot start
+    google_available = True
     try:
         client, events_collection = connect_to_mongodb()
         events = events_collection.find({})
@@ -356,8 +417,8 @@ def update_event_images():
                 logger.info(f"Searching for image for {event_name}...")
                 
                 # Determine if this is a religious event
-                is_religious_event = any(term in category.lower() for term in 
-                    ['religion', 'faith', 'holy', 'sacred', 'spiritual', 'bahá\'í'])
+                category_lower = category.lower()
+                is_religious_event = any(term in category_lower for term in RELIGIOUS_EVENT_TERMS)
                 
                 # Generate search variations
                 search_variations = generate_search_variations(event_name, category)
@@ -376,10 +437,21 @@ def update_event_images():
                         break
                     
                     # Then try Google
-                    image_url = search_google_images(search_term, is_religious_event)
-                    if image_url:
-                        source_used = f"Google Images ({search_term})"
-                        break
+                    if google_available:
+                        try:
+                            get_shared_driver()
+                        except Exception as e:
+                            logger.error(f"Chrome unavailable, using Wikimedia Commons only: {e}")
+                            google_available = False
+                    if google_available:
+                        try:
+                            image_url = search_google_images(search_term, is_religious_event)
+                        except Exception as e:
+                            logger.error(f"Google Image search failed for {search_term}: {e}")
+                            image_url = None
+                        if image_url:
+                            source_used = f"Google Images ({search_term})"
+                            break
                     
                     # Add delay between attempts
                     time.sleep(2)
@@ -421,6 +493,7 @@ def update_event_images():
         logger.error(f"Error processing events: {e}")
         raise
     finally:
+        close_shared_driver()
         if 'client' in locals():
             client.close()
             logger.info("Database connection closed")
@@ -11,44 +11,39 @@ client = MongoClient(MONGO_URI)
 db = client.events_db
 events_collection = db.events
 
-def find_events_without_additional_details():
+# Description fields to report on
+DESCRIPTION_FIELDS = ["additional_details", "concise_details"]
+
+def find_events_without_description_fields():
     """
-    Find events in the database that don't have the additional_details field.
+    Find events in the database missing each description field.
+    Both lookups run server-side in a single aggregation round-trip.
     """
-    # Find events where additional_details field is missing
-    events_without_descriptions = events_collection.find({
-        "additional_details": {"$exists": False}
-    })
-    
-    # Convert to list and print results
-    events_list = list(events_without_descriptions)
-    
-    print(f"Total events without additional_details: {len(events_list)}")
-    
-    for event in events_list:
-        print(f"Event without additional_details: {event.get('name', 'Unnamed Event')}")
+    pipeline = [{
+        "$facet": {
+            field: [
+                {"$match": {field: {"$exists": False}}},
+                {"$project": {"_id": 0, "name": 1}}
+            ]
+            for field in DESCRIPTION_FIELDS
+        }
+    }]
+    return next(events_collection.aggregate(pipeline))
 
-def find_events_without_concise_details():
+def print_events_without_field(field, events_list):
     """
-    Find events in the database that don't have the concise_details field.
+    Print the events that don't have the given description field.
     """
-    # Find events where concise_details field is missing
-    events_without_descriptions = events_collection.find({
-        "concise_details": {"$exists": False}
-    })
-    
-    # Convert to list and print results
-    events_list = list(events_without_descriptions)
-    
-    print(f"Total events without concise_details: {len(events_list)}")
-    
+    print(f"Total events without {field}: {len(events_list)}")
+
     for event in events_list:
-        print(f"Event without concise_details: {event.get('name', 'Unnamed Event')}")
+        print(f"Event without {field}: {event.get('name', 'Unnamed Event')}")
 
 def main():
     try:
-        find_events_without_additional_details()
-        find_events_without_concise_details()
+        missing = find_events_without_description_fields()
+        for field in DESCRIPTION_FIELDS:
+            print_events_without_field(field, missing[field])
 
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pymongo import MongoClient
 from dotenv import load_dotenv
 
@@ -13,11 +14,20 @@ events_collection = db.events
 
 # Define the images directory
 IMAGES_DIR = r"C:\Users\Arnav\Desktop\Code\EDIProject\frontend\public\images"
+PUBLIC_DIR = r"C:\Users\Arnav\Desktop\Code\EDIProject\frontend\public"
+
+@lru_cache(maxsize=None)
+def list_directory(directory):
+    """Return the (case-normalized) file names in a directory, read once per run."""
+    try:
+        return frozenset(os.path.normcase(name) for name in os.listdir(directory))
+    except OSError:
+        return frozenset()
 
 def check_missing_images():
     """Check which events are missing images."""
-    # Get all events from database
-    events = events_collection.find({})
+    # Get all events from database, with only the fields the report uses
+    events = events_collection.find({}, {"_id": 0, "name": 1, "image_url": 1})
     
     # Keep track of missing images
     missing_images = []
@@ -35,10 +45,11 @@ def check_missing_images():
             continue
             
         # Get the full path where the image should be
-        image_full_path = os.path.join(r"C:\Users\Arnav\Desktop\Code\EDIProject\frontend\public", image_path)
+        image_full_path = os.path.normpath(os.path.join(PUBLIC_DIR, image_path))
+        directory, filename = os.path.split(image_full_path)
         
-        # Check if image exists
-        if not os.path.exists(image_full_path):
+        # Check if image exists against a single listing of its directory
+        if os.path.normcase(filename) not in list_directory(directory):
             missing_images.append(event_name)
     
     # Print results
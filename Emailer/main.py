@@ -88,25 +88,25 @@ class MonthlyEventMailer:
 
         
 
-        events = list(self.events_collection.find({
+        # Only fetch the fields the digest renders (_id is kept for the event links)
 
-            "$or": [
+        # The overlap test covers events that start, end, or span the month; events
 
-                {"start_date": {"$gte": month_start, "$lt": month_end}},
+        # missing one date (the date updaters may store only one) match on the other
 
-                {"end_date": {"$gte": month_start, "$lt": month_end}},
+        events = list(self.events_collection.find({
 
-                {
+            "$or": [
 
-                    "start_date": {"$lt": month_end},
+                {"start_date": {"$lt": month_end}, "end_date": {"$gte": month_start}},
 
-                    "end_date": {"$gte": month_start}
+                {"start_date": {"$gte": month_start, "$lt": month_end}, "end_date": None},
 
-                }
+                {"end_date": {"$gte": month_start, "$lt": month_end}, "start_date": None}
 
             ]
 
-        }).sort("start_date", 1))
+        }, {"name": 1, "start_date": 1, "end_date": 1}).sort("start_date", 1))
 
         
 
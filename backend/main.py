@@ -1,11 +1,16 @@
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pymongo import MongoClient
+from bson import ObjectId
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 import logging
+import os
 
-logging.basicConfig(level=logging.DEBUG)
+# DEBUG logging from pymongo and the server on every request is costly under load;
+# default to INFO and allow turning it back up with LOG_LEVEL=DEBUG
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 app = FastAPI()
@@ -18,29 +23,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-client = MongoClient("mongodb://localhost:27017/")
+# One client is shared by all request threads; size its pool to the expected concurrency
+MONGO_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
+client = MongoClient(MONGO_URI, maxPoolSize=int(os.getenv('MONGO_POOL_SIZE', '50')))
 db = client.events_db
 events_collection = db.events
 
 def serialize_event(event):
+    # Datetimes are encoded natively when the response is serialized; only the ObjectId needs converting
     event['_id'] = str(event['_id'])
-    for field in ['start_date', 'end_date', 'created_at', 'last_updated']:
-        if isinstance(event.get(field), datetime):
-            event[field] = event[field].isoformat()
     return event
 
+def find_events(query, limit=None):
+    # Sorted event listing with the ObjectId stringified server-side, so the
+    # documents can be returned as-is without a per-event Python pass
+    pipeline = [{"$match": query}, {"$sort": {"start_date": 1}}]
+    if limit:
+        # Mirrors find().limit(): 0 means no limit and negatives use their absolute value
+        pipeline.append({"$limit": abs(limit)})
+    pipeline.append({"$addFields": {"_id": {"$toString": "$_id"}}})
+    return list(events_collection.aggregate(pipeline))
+
+# Declared sync so FastAPI runs the blocking pymongo calls in its threadpool
+# instead of stalling the event loop for every concurrent request; the return
+# type lets FastAPI serialize the response straight to JSON bytes via Pydantic
 @app.get("/")
-async def root(
+def root(
     event_id: Optional[str] = None,
     date: Optional[str] = None,
     year: Optional[int] = None,
     month: Optional[int] = None,
     upcoming_days: Optional[int] = Query(None, alias="days")
-):
+) -> Dict[str, Any]:
     try:
         # Get single event by ID
         if event_id:
-            event = events_collection.find_one({"_id": event_id})
+            # Ids are stored as ObjectIds, so convert the query string to match on the _id index
+            event = None
+            if ObjectId.is_valid(event_id):
+                event = events_collection.find_one({"_id": ObjectId(event_id)})
             if not event:
                 raise HTTPException(status_code=404, detail="Event not found")
             return {"event": serialize_event(event)}
@@ -49,11 +70,11 @@ async def root(
         if date:
             try:
                 target_date = datetime.fromisoformat(date)
-                events = list(events_collection.find({
+                events = find_events({
                     "start_date": {"$lte": target_date},
                     "end_date": {"$gte": target_date}
-                }).sort("start_date", 1))
-                return {"events": [serialize_event(event) for event in events]}
+                })
+                return {"events": events}
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid date format: {date}")
 
@@ -65,31 +86,33 @@ async def root(
             else:
                 end_date = datetime(year, month + 1, 1)
             
-            events = list(events_collection.find({
+            # The overlap test covers events that start, end, or span the month; events
+            # missing one date (the date updaters may store only one) match on the other
+            events = find_events({
                 "$or": [
-                    {"start_date": {"$gte": start_date, "$lt": end_date}},
-                    {"end_date": {"$gte": start_date, "$lt": end_date}},
-                    {"start_date": {"$lte": start_date}, "end_date": {"$gte": end_date}}
+                    {"start_date": {"$lt": end_date}, "end_date": {"$gte": start_date}},
+                    {"start_date": {"$gte": start_date, "$lt": end_date}, "end_date": None},
+                    {"end_date": {"$gte": start_date, "$lt": end_date}, "start_date": None}
                 ]
-            }).sort("start_date", 1))
-            return {"events": [serialize_event(event) for event in events]}
+            })
+            return {"events": events}
 
         # Get upcoming events
         if upcoming_days is not None:
             current_date = datetime.now()
-            events = list(events_collection.find({
+            events = find_events({
                 "end_date": {"$gte": current_date}
-            }).sort("start_date", 1).limit(upcoming_days))
-            return {"events": [serialize_event(event) for event in events]}
+            }, limit=upcoming_days)
+            return {"events": events}
 
         # Default: get all events and API status
-        event_count = events_collection.count_documents({})
-        events = list(events_collection.find().sort("start_date", 1))
+        # The full listing already gives the count, so skip a separate count_documents round-trip
+        events = find_events({})
         return {
             "status": "API is running",
-            "total_events": event_count,
+            "total_events": len(events),
             "database_connection": "successful",
-            "events": [serialize_event(event) for event in events]
+            "events": events
         }
 
     except Exception as e:
@@ -98,4 +121,4 @@ async def root(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=3600, log_level="debug")
+    uvicorn.run(app, host="0.0.0.0", port=3600, log_level=LOG_LEVEL.lower())
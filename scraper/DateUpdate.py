@@ -1,14 +1,17 @@
 import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
-from fuzzywuzzy import fuzz
-from pymongo import MongoClient
+from rapidfuzz import fuzz, process
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 import unicodedata
 import calendar
 from dateutil import parser
@@ -31,6 +34,21 @@ HEADERS = {
     'Connection': 'keep-alive',
 }
 
+# lxml parses much faster; fall back to the stdlib parser when it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Parse only the parts of each page the scrapers read, skipping scripts, nav and footers
+TABLE_STRAINER = SoupStrainer("table")
+ONTARIO_STRAINER = SoupStrainer(["h3", "ul"])
+OBSERVER_STRAINER = SoupStrainer("main", id="page")
+
+# Shared session so repeated requests to the same host reuse pooled keep-alive connections
+http_session = requests.Session()
+
 # Define source URLs as constants
 YORK_URL = "https://registrar.yorku.ca/enrol/dates/religious-accommodation-resource-2024-2025"
 CANADA_URL = "https://www.canada.ca/en/canadian-heritage/services/important-commemorative-days.html"
@@ -39,16 +57,85 @@ XAVIER_URL = "https://www.xavier.edu/jesuitresource/online-resources/calendar-re
 INTERFAITH_URL = "https://www.interfaith-calendar.org/"
 INTERFAITH_OBSERVER_URL = "https://www.theinterfaithobserver.org/religious-calendar"
 
+# Lookup tables shared by the date parsers
+MONTH_NUMBERS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+MONTH_ABBREVIATIONS = {name[:3]: number for name, number in MONTH_NUMBERS.items()}
+ORDINAL_NUMBERS = {
+    "first": 1,
+    "second": 2,
+    "third": 3,
+    "fourth": 4
+}
+WEEKDAY_NUMBERS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6
+}
 
+# Regular expressions used by the normalizers and date parsers, compiled once
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+BRACKETED_TEXT_PATTERN = re.compile(r'\(.*?\)|\[.*?\]|\*+')
+NTH_WEEKDAY_PATTERN = re.compile(
+    r"\b(first|second|third|fourth)\s+"
+    r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+"
+    r"(?:in|of)\s+([A-Za-z]+)(?:\s+(\d{4}))?\b",
+    flags=re.IGNORECASE
+)
+SUNSET_RANGE_PATTERN = re.compile(
+    r"[Bb]egins\s+at\s+sunset\s+([A-Za-z]+\s+\d{1,2},?\s*\d{4})\s+and\s+ends\s+at\s+nightfall\s+on\s+([A-Za-z]+\s+\d{1,2},?\s*\d{4})"
+)
+BEGINS_ENDS_PATTERN = re.compile(
+    r"[Bb]egins.*on\s+([A-Za-z]+\s+\d{1,2},\s*\d{4}).*ends.*on\s+([A-Za-z]+\s+\d{1,2},\s*\d{4})"
+)
+SIMPLE_DATE_PATTERN = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})")
+RELIGIOUS_RANGE_PATTERN = re.compile(
+    r"[Bb]egins\s+(?:at\s+sunset\s+)?(?:on\s+)?([A-Za-z]+\s+\d{1,2}(?:,\s*|\s+)\d{4})(?:\s+and\s+ends\s+(?:the\s+evening\s+of\s+|at\s+nightfall\s+on\s+|on\s+)?([A-Za-z]+\s+\d{1,2}(?:,\s*|\s+)\d{4}))",
+    re.DOTALL
+)
+MONTH_YEAR_PATTERN = re.compile(r"([A-Za-z]+)\s+(\d{4})")
+
+# Regular expressions used inside the scraper loops, compiled once
+NAME_DELIMITER_PATTERN = re.compile('|'.join(map(re.escape, ["/", ",", "&"])))
+PARENTHETICAL_PATTERN = re.compile(r'\s*\([^)]*\)')
+RANGE_SEPARATOR_PATTERN = re.compile(r'\s+(?:to|-)\s+')
+DIGITS_PATTERN = re.compile(r'(\d+)')
+LETTERS_PATTERN = re.compile(r'([A-Za-z]+)')
+CANADA_MONTH_ID_PATTERN = re.compile(r'^m\d+')
+MONTH_DAY_PREFIX_PATTERN = re.compile(r'^[A-Za-z]+ \d{1,2}')
+CANADA_DATE_PATTERN = re.compile(r'^([A-Za-z]+ \d+|\w+ week|\w+ \w+ of [A-Za-z]+)(.*)')
+LINK_TEXT_PATTERN = re.compile(r'\s*\[.*?\]')
+DASH_SUFFIX_PATTERN = re.compile(r'\s+[-–]\s+')
+MONTH_DAY_RANGE_PATTERN = re.compile(r'([A-Za-z]+\s+\d+)\s*[-to]+\s*([A-Za-z]+\s+\d+)')
+MONTH_DAY_PATTERN = re.compile(r'([A-Za-z]+\s+\d+)')
+END_DATE_PATTERNS = (
+    re.compile(r'until\s+(\w+\s+\d{1,2})'),
+    re.compile(r'through\s+(\w+\s+\d{1,2})'),
+    re.compile(r'ends\s+(\w+\s+\d{1,2})')
+)
+MONTH_YEAR_HEADER_PATTERN = re.compile(r'^([A-Za-z]+)\s+(\d{4})$')
+WEEKDAY_DATE_HEADER_PATTERN = re.compile(r'^[A-Za-z]+,\s*([A-Za-z]+)\s+(\d{1,2})$')
+ENDS_ON_PATTERN = re.compile(r'Ends\s+([A-Za-z]+)\s+(\d{1,2})', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def normalize_event_name(name: str) -> str:
     """
     Normalize event name: lowercase, remove diacritics, remove special characters.
+    Results are cached since the same names recur across scrapers and events.
     """
     normalized = name.lower()
     normalized = ''.join(
         c for c in unicodedata.normalize('NFKD', normalized) if not unicodedata.combining(c)
     )
-    normalized = re.sub(r'[^\w\s]', '', normalized).strip()
+    normalized = NON_WORD_PATTERN.sub('', normalized).strip()
     return normalized
 
 
@@ -107,42 +194,15 @@ def parse_nth_weekday_pattern(raw_text: str) -> Optional[Tuple[date, date]]:
     - "Third Monday in January 2025"
     - "Fourth Saturday of November"
     """
-    pattern = re.compile(
-        r"\b(first|second|third|fourth)\s+"
-        r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+"
-        r"(?:in|of)\s+([A-Za-z]+)(?:\s+(\d{4}))?\b",
-        flags=re.IGNORECASE
-    )
-    match = pattern.search(raw_text)
+    match = NTH_WEEKDAY_PATTERN.search(raw_text)
     if not match:
         return None
 
     ordinal_str, weekday_str, month_str, year_str = match.groups()
 
-    ordinal_map = {
-        "first": 1,
-        "second": 2,
-        "third": 3,
-        "fourth": 4
-    }
-    weekday_map = {
-        "monday": 0,
-        "tuesday": 1,
-        "wednesday": 2,
-        "thursday": 3,
-        "friday": 4,
-        "saturday": 5,
-        "sunday": 6
-    }
-    month_map = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12
-    }
-
-    nth = ordinal_map.get(ordinal_str.lower())
-    wday = weekday_map.get(weekday_str.lower())
-    month_num = month_map.get(month_str.lower())
+    nth = ORDINAL_NUMBERS.get(ordinal_str.lower())
+    wday = WEEKDAY_NUMBERS.get(weekday_str.lower())
+    month_num = MONTH_NUMBERS.get(month_str.lower())
     year = int(year_str) if year_str else 2025  # Default to 2025 if year not provided
 
     if not (nth and wday is not None and month_num):
@@ -164,10 +224,7 @@ def parse_date_range(raw_text: str) -> Tuple[Optional[date], Optional[date]]:
    cleaned_text = raw_text.replace('.', '').strip()
 
    # Pattern for Ramadan and similar sunset/nightfall events
-   sunset_pattern = re.compile(
-       r"[Bb]egins\s+at\s+sunset\s+([A-Za-z]+\s+\d{1,2},?\s*\d{4})\s+and\s+ends\s+at\s+nightfall\s+on\s+([A-Za-z]+\s+\d{1,2},?\s*\d{4})"
-   )
-   match = sunset_pattern.search(cleaned_text)
+   match = SUNSET_RANGE_PATTERN.search(cleaned_text)
    if match:
        start_str, end_str = match.groups()
        try:
@@ -191,10 +248,7 @@ def parse_date_range(raw_text: str) -> Tuple[Optional[date], Optional[date]]:
        return nth_pattern_result
 
    # Pattern: "Begins ... on Mar 1, 2025 ... ends ... on Mar 30, 2025"
-   pattern_begins_ends = re.compile(
-       r"[Bb]egins.*on\s+([A-Za-z]+\s+\d{1,2},\s*\d{4}).*ends.*on\s+([A-Za-z]+\s+\d{1,2},\s*\d{4})"
-   )
-   match = pattern_begins_ends.search(cleaned_text)
+   match = BEGINS_ENDS_PATTERN.search(cleaned_text)
    if match:
        start_str, end_str = match.groups()
        start_dt = parse_month_day_year(start_str)
@@ -203,26 +257,17 @@ def parse_date_range(raw_text: str) -> Tuple[Optional[date], Optional[date]]:
            return (start_dt, end_dt)
 
    # Pattern: "July 9, 2025" (simple date)
-   date_pattern = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})")
-   match = date_pattern.search(cleaned_text)
+   match = SIMPLE_DATE_PATTERN.search(cleaned_text)
    if match:
        month_str, day_str, year_str = match.groups()
        try:
-           month_num = {
-               'january': 1, 'february': 2, 'march': 3, 'april': 4,
-               'may': 5, 'june': 6, 'july': 7, 'august': 8,
-               'september': 9, 'october': 10, 'november': 11, 'december': 12
-           }[month_str.lower()]
+           month_num = MONTH_NUMBERS[month_str.lower()]
            return (date(int(year_str), month_num, int(day_str)), date(int(year_str), month_num, int(day_str)))
        except (ValueError, KeyError):
            pass
 
    # Pattern: "Begins at sunset ... ends nightfall/evening"
-   religious_pattern = re.compile(
-       r"[Bb]egins\s+(?:at\s+sunset\s+)?(?:on\s+)?([A-Za-z]+\s+\d{1,2}(?:,\s*|\s+)\d{4})(?:\s+and\s+ends\s+(?:the\s+evening\s+of\s+|at\s+nightfall\s+on\s+|on\s+)?([A-Za-z]+\s+\d{1,2}(?:,\s*|\s+)\d{4}))",
-       re.DOTALL
-   )
-   match = religious_pattern.search(cleaned_text)
+   match = RELIGIOUS_RANGE_PATTERN.search(cleaned_text)
    if match:
        start_str, end_str = match.groups()
        start_dt = parse_month_day_year(start_str)
@@ -231,16 +276,11 @@ def parse_date_range(raw_text: str) -> Tuple[Optional[date], Optional[date]]:
            return (start_dt, end_dt)
 
    # Pattern for month-long events
-   month_pattern = re.compile(r"([A-Za-z]+)\s+(\d{4})")
-   match = month_pattern.search(cleaned_text)
+   match = MONTH_YEAR_PATTERN.search(cleaned_text)
    if match and "month" in cleaned_text.lower():
        month_str, year_str = match.groups()
        try:
-           month_num = {
-               'january': 1, 'february': 2, 'march': 3, 'april': 4,
-               'may': 5, 'june': 6, 'july': 7, 'august': 8,
-               'september': 9, 'october': 10, 'november': 11, 'december': 12
-           }[month_str.lower()]
+           month_num = MONTH_NUMBERS[month_str.lower()]
            start_date = date(int(year_str), month_num, 1)
            if month_num == 12:
                end_date = date(int(year_str) + 1, 1, 1) - timedelta(days=1)
@@ -267,23 +307,20 @@ def scrape_york_accommodations() -> Dict[str, Tuple[Optional[date], Optional[dat
         Split the exact event name into individual names based on delimiters.
         Returns a list of individual names.
         """
-        # Define possible delimiters
-        delimiters = ["/", ",", "&"]
-        pattern = '|'.join(map(re.escape, delimiters))
-        # Split the name and strip whitespace
-        individual_names = re.split(pattern, exact_name)
+        # Split the name on "/", "," and "&" and strip whitespace
+        individual_names = NAME_DELIMITER_PATTERN.split(exact_name)
         individual_names = [name.strip() for name in individual_names if name.strip()]
         return individual_names
 
     try:
         # Fetch the page
-        resp = requests.get(YORK_URL, headers=HEADERS, timeout=10)
+        resp = http_session.get(YORK_URL, headers=HEADERS, timeout=10)
         if resp.status_code != 200:
             print(f"[YORK] Failed to retrieve page (status {resp.status_code}).")
             return accommodations
 
         # Parse HTML
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=TABLE_STRAINER)
         table = soup.find("table")
         if not table or not table.find("tbody"):
             print("[YORK] Could not find table/tbody on the page.")
@@ -305,7 +342,7 @@ def scrape_york_accommodations() -> Dict[str, Tuple[Optional[date], Optional[dat
                 continue
 
             # Remove parenthetical text for exact version
-            exact_name = re.sub(r'\s*\([^)]*\)', '', raw_name).strip()
+            exact_name = PARENTHETICAL_PATTERN.sub('', raw_name).strip()
 
             # Store the exact combined name
             accommodations[exact_name] = (start_dt, end_dt)
@@ -349,7 +386,7 @@ def scrape_canada_commemorative() -> Dict[str, Tuple[Optional[date], Optional[da
         text = ''.join(c for c in unicodedata.normalize('NFKD', name)
                       if not unicodedata.combining(c))
         # Remove special characters and normalize whitespace
-        text = re.sub(r'[^\w\s]', '', text)
+        text = NON_WORD_PATTERN.sub('', text)
         text = ' '.join(text.lower().split())
         return text
 
@@ -372,7 +409,7 @@ def scrape_canada_commemorative() -> Dict[str, Tuple[Optional[date], Optional[da
         
         # Handle date ranges with "to" or "-"
         if " to " in text or " - " in text:
-            parts = re.split(r'\s+(?:to|-)\s+', text)
+            parts = RANGE_SEPARATOR_PATTERN.split(text)
             if len(parts) == 2:
                 start_str, end_str = parts
                 try:
@@ -385,7 +422,7 @@ def scrape_canada_commemorative() -> Dict[str, Tuple[Optional[date], Optional[da
         # Handle single dates
         try:
             if month:
-                day = int(re.search(r'\d+', text).group())
+                day = int(DIGITS_PATTERN.search(text).group())
                 return (date(current_year, month, day),
                         date(current_year, month, day))
             else:
@@ -397,15 +434,15 @@ def scrape_canada_commemorative() -> Dict[str, Tuple[Optional[date], Optional[da
         return (None, None)
 
     try:
-        resp = requests.get(CANADA_URL, timeout=10)
+        resp = http_session.get(CANADA_URL, timeout=10)
         if resp.status_code != 200:
             print(f"[CANADA] Failed to retrieve page (status {resp.status_code}).")
             return accommodations
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
         
         # Process each month's section
-        for month_header in soup.find_all('h2', attrs={'id': re.compile(r'^m\d+')}):
+        for month_header in soup.find_all('h2', attrs={'id': CANADA_MONTH_ID_PATTERN}):
             month_name = month_header.text.strip()
             try:
                 month_num = datetime.strptime(month_name, '%B').month
@@ -425,7 +462,7 @@ def scrape_canada_commemorative() -> Dict[str, Tuple[Optional[date], Optional[da
                     continue
                 
                 # Handle month-long events (no specific date mentioned)
-                if 'Month' in text and not re.match(r'^[A-Za-z]+ \d{1,2}', text):
+                if 'Month' in text and not MONTH_DAY_PREFIX_PATTERN.match(text):
                     start_dt = date(current_year, month_num, 1)
                     if month_num == 12:
                         end_dt = date(current_year + 1, 1, 1) - timedelta(days=1)
@@ -440,7 +477,7 @@ def scrape_canada_commemorative() -> Dict[str, Tuple[Optional[date], Optional[da
                     continue
 
                 # Handle specific dates
-                date_match = re.match(r'^([A-Za-z]+ \d+|\w+ week|\w+ \w+ of [A-Za-z]+)(.*)', text)
+                date_match = CANADA_DATE_PATTERN.match(text)
                 if date_match:
                     date_str, name_str = date_match.groups()
                     name_str = name_str.strip(' -').strip()
@@ -468,12 +505,12 @@ def scrape_ontario_commemorative() -> Dict[str, Tuple[Optional[date], Optional[d
     current_year = 2025
 
     try:
-        resp = requests.get(ONTARIO_URL, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+        resp = http_session.get(ONTARIO_URL, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
         if resp.status_code != 200:
             print(f"[ONTARIO] Failed to retrieve page (status {resp.status_code}).")
             return accommodations
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=ONTARIO_STRAINER)
         current_month = None
         
         for section in soup.find_all(['h3', 'ul']):
@@ -493,18 +530,18 @@ def scrape_ontario_commemorative() -> Dict[str, Tuple[Optional[date], Optional[d
                             continue
 
                         # Clean up the event name
-                        text = re.sub(r'\s*\[.*?\]', '', text)  # Remove link text
-                        name = re.split(r'\s+[-–]\s+', text)[0].strip()  # Remove text after dash
+                        text = LINK_TEXT_PATTERN.sub('', text)  # Remove link text
+                        name = DASH_SUFFIX_PATTERN.split(text)[0].strip()  # Remove text after dash
                         
                         # Store both versions of the name
-                        exact_name = re.sub(r'\s*\([^)]*\)', '', name).strip()
+                        exact_name = PARENTHETICAL_PATTERN.sub('', name).strip()
                         norm_name = normalize_event_name(exact_name)
                         
                         # Match various date patterns
                         start_dt = end_dt = None
                         
                         # Month-long events
-                        if 'Month' in text and not re.search(r'\d+', text):
+                        if 'Month' in text and not DIGITS_PATTERN.search(text):
                             start_dt = date(current_year, current_month, 1)
                             if current_month == 12:
                                 end_dt = date(current_year + 1, 1, 1) - timedelta(days=1)
@@ -520,9 +557,9 @@ def scrape_ontario_commemorative() -> Dict[str, Tuple[Optional[date], Optional[d
                                 start_dt = end_dt = date(current_year, current_month, mondays[2])
                         
                         # Handle specific dates
-                        elif re.search(r'\d+', text):
+                        elif DIGITS_PATTERN.search(text):
                             # Try date range pattern first
-                            range_match = re.search(r'([A-Za-z]+\s+\d+)\s*[-to]+\s*([A-Za-z]+\s+\d+)', text)
+                            range_match = MONTH_DAY_RANGE_PATTERN.search(text)
                             if range_match:
                                 try:
                                     start_str = f"{range_match.group(1)} {current_year}"
@@ -533,7 +570,7 @@ def scrape_ontario_commemorative() -> Dict[str, Tuple[Optional[date], Optional[d
                                     pass
                             else:
                                 # Try single date pattern
-                                date_match = re.search(r'([A-Za-z]+\s+\d+)', text)
+                                date_match = MONTH_DAY_PATTERN.search(text)
                                 if date_match:
                                     try:
                                         date_str = f"{date_match.group(1)} {current_year}"
@@ -577,12 +614,12 @@ def scrape_xavier_calendar() -> Dict[str, Tuple[Optional[date], Optional[date]]]
     accommodations = {}
     
     try:
-        resp = requests.get(XAVIER_URL, headers=HEADERS, timeout=10)
+        resp = http_session.get(XAVIER_URL, headers=HEADERS, timeout=10)
         if resp.status_code != 200:
             print(f"[XAVIER] Failed to retrieve page (status {resp.status_code}).")
             return accommodations
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=TABLE_STRAINER)
         
         # Find the main table containing the calendar
         table = soup.find("table", class_="table")
@@ -603,16 +640,8 @@ def scrape_xavier_calendar() -> Dict[str, Tuple[Optional[date], Optional[date]]]
                 
             # Check if this is a month header row
             first_col = cols[0].get_text(strip=True).lower()
-            if len(cols) >= 4 and first_col in [
-                'january', 'february', 'march', 'april', 'may', 'june', 
-                'july', 'august', 'september', 'october', 'november', 'december'
-            ]:
-                month_map = {
-                    'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                    'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                    'september': 9, 'october': 10, 'november': 11, 'december': 12
-                }
-                current_month = month_map.get(first_col)
+            if len(cols) >= 4 and first_col in MONTH_NUMBERS:
+                current_month = MONTH_NUMBERS[first_col]
                 print(f"[XAVIER] Processing month: {first_col}")
                 continue
 
@@ -628,24 +657,19 @@ def scrape_xavier_calendar() -> Dict[str, Tuple[Optional[date], Optional[date]]]
                     # Handle various date formats
                     if "-" in date_text:
                         # Handle date ranges
-                        if any(m in date_text.lower() for m in [
-                            'jan', 'feb', 'mar', 'apr', 'may', 'jun', 
-                            'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
+                        date_text_lower = date_text.lower()
+                        if any(m in date_text_lower for m in MONTH_ABBREVIATIONS):
                             # Cross-month range
                             parts = date_text.replace(".", "").split("-")
                             if len(parts) == 2:
                                 # Extract start month and day
                                 start_text = parts[0].strip()
-                                month_match = re.search(r'([A-Za-z]+)', start_text)
-                                day_match = re.search(r'(\d+)', start_text)
+                                month_match = LETTERS_PATTERN.search(start_text)
+                                day_match = DIGITS_PATTERN.search(start_text)
                                 
                                 if month_match and day_match:
-                                    month_name = month_match.group(1)[:3]
-                                    month_map = {
-                                        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                                        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                                    }
-                                    start_month = month_map.get(month_name)
+                                    month_name = month_match.group(1)[:3].lower()
+                                    start_month = MONTH_ABBREVIATIONS.get(month_name)
                                     start_day = int(day_match.group(1))
                                     end_day = int(parts[1].strip())
                                     
@@ -688,13 +712,13 @@ def scrape_interfaith_calendar() -> Dict[str, Tuple[Optional[date], Optional[dat
     current_year = 2025  # Default to 2025
 
     try:
-        resp = requests.get(INTERFAITH_URL, headers=HEADERS, timeout=10)
+        resp = http_session.get(INTERFAITH_URL, headers=HEADERS, timeout=10)
         if resp.status_code != 200:
             print(f"[INTERFAITH] Failed to retrieve page (status {resp.status_code}).")
             print(f"[INTERFAITH] Response content: {resp.text[:200]}")  # Print first 200 chars for debugging
             return accommodations
 
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=TABLE_STRAINER)
         
         # Find the calendar table
         calendar_table = soup.find('table', class_='calendar-table')
@@ -740,13 +764,8 @@ def scrape_interfaith_calendar() -> Dict[str, Tuple[Optional[date], Optional[dat
                                 # Look for duration patterns
                                 if any(pattern in desc_text for pattern in ['until', 'through', 'ends']):
                                     # Try to extract end date
-                                    date_patterns = [
-                                        r'until\s+(\w+\s+\d{1,2})',
-                                        r'through\s+(\w+\s+\d{1,2})',
-                                        r'ends\s+(\w+\s+\d{1,2})'
-                                    ]
-                                    for pattern in date_patterns:
-                                        match = re.search(pattern, desc_text)
+                                    for pattern in END_DATE_PATTERNS:
+                                        match = pattern.search(desc_text)
                                         if match:
                                             end_str = f"{match.group(1)}, {current_year}"
                                             try:
@@ -773,53 +792,137 @@ def scrape_interfaith_calendar() -> Dict[str, Tuple[Optional[date], Optional[dat
         
     return accommodations
 
+def fuzzy_match_indices(name: str, choices: Tuple[str, ...]) -> set:
+    """
+    Return the indices of every choice whose fuzzy ratio with name exceeds 85.
+    All choices are scored in a single rapidfuzz call instead of a Python loop.
+    rapidfuzz scores are floats, so the cutoff is 85.5 to keep fuzzywuzzy's
+    rounded-integer "> 85" threshold.
+    """
+    return {
+        index for _, _, index in process.extract(
+            name, choices, scorer=fuzz.ratio, score_cutoff=85.5, limit=None
+        )
+    }
+
+
+CALENDARIFIC_BASE_URL = "https://calendarific.com/api/v2/holidays"
+API_NINJAS_URL = "https://api.api-ninjas.com/v1/holidays"
+HOLIDAY_API_YEAR = 2025  # Current target year
+
+
+def index_holiday_names(api_names: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Map each holiday name to the index of its first occurrence for exact lookups.
+    """
+    index_by_name = {}
+    for index, api_name in enumerate(api_names):
+        index_by_name.setdefault(api_name, index)
+    return index_by_name
+
+
+@lru_cache(maxsize=None)
+def load_calendarific_holidays(country: str, year: int, api_key: str) -> Tuple[Tuple[str, ...], Tuple[Dict, ...], Dict[str, int]]:
+    """
+    Fetch one country's Calendarific holiday list, once per run.
+    Returns (lowercased holiday names, holidays, first index of each name).
+    Errors are raised rather than
+    returned so that a failed request is retried instead of cached.
+    """
+    params = {
+        "api_key": api_key,
+        "country": country,
+        "year": year,
+    }
+
+    response = http_session.get(CALENDARIFIC_BASE_URL, params=params, timeout=10)
+    if response.status_code != 200:
+        raise ValueError(f"API error: {response.status_code}")
+
+    data = orjson.loads(response.content)
+    if "response" not in data or "holidays" not in data["response"]:
+        raise ValueError("Unexpected response format")
+
+    holidays = tuple(data["response"]["holidays"])
+    api_names = tuple(holiday["name"].lower() for holiday in holidays)
+    return api_names, holidays, index_holiday_names(api_names)
+
+
+@lru_cache(maxsize=None)
+def load_apininjas_holidays(country: str, year: int, api_key: str) -> Tuple[Tuple[str, ...], Tuple[Dict, ...], Dict[str, int]]:
+    """
+    Fetch one country's API Ninjas holiday list, once per run.
+    Returns (lowercased holiday names, holidays, first index of each name).
+    Errors are raised rather than
+    returned so that a failed request is retried instead of cached.
+    """
+    params = {
+        "country": country,
+        "year": year
+    }
+
+    headers = {
+        'X-Api-Key': api_key,
+        'Accept': 'application/json'
+    }
+
+    response = http_session.get(API_NINJAS_URL, headers=headers, params=params, timeout=10)
+    if response.status_code != 200:
+        raise ValueError(f"API error: {response.status_code}")
+
+    holidays = orjson.loads(response.content)
+    if not isinstance(holidays, list):
+        raise ValueError("Unexpected response format")
+
+    holidays = tuple(holidays)
+    api_names = tuple(holiday.get("name", "").lower() for holiday in holidays)
+    return api_names, holidays, index_holiday_names(api_names)
+
+
+def match_holiday_indices(event_name_lower: str, api_names: Tuple[str, ...], index_by_name: Dict[str, int]):
+    """
+    Yield the indices of holidays matching an event name, shared by both holiday APIs.
+    An exact name match comes first; the substring/fuzzy scan only runs if the caller
+    asks for more candidates, so exact hits never pay for rapidfuzz scoring.
+    """
+    exact_index = index_by_name.get(event_name_lower)
+    if exact_index is not None:
+        yield exact_index
+
+    fuzzy_matches = fuzzy_match_indices(event_name_lower, api_names)
+    for index, api_name in enumerate(api_names):
+        if index == exact_index:
+            continue
+        if (event_name_lower in api_name or
+            api_name in event_name_lower or
+            index in fuzzy_matches):
+            yield index
+
+
 def fetch_from_calendarific(event_name: str, api_key: str) -> Tuple[Optional[date], Optional[date]]:
     """
     Query the Calendarific API to find dates for an event.
     Returns (start_date, end_date) tuple or (None, None) if not found.
     """
-    CALENDARIFIC_BASE_URL = "https://calendarific.com/api/v2/holidays"
-    
     # Try both Canada and US as fallback sources
     countries = ["CA", "US"]
-    year = 2025  # Current target year
+    event_name_lower = event_name.lower()
     
     for country in countries:
         try:
-            params = {
-                "api_key": api_key,
-                "country": country,
-                "year": year,
-            }
-            
-            response = requests.get(CALENDARIFIC_BASE_URL, params=params, timeout=10)
-            if response.status_code != 200:
-                print(f"[CALENDARIFIC] API error for {country}: {response.status_code}")
-                continue
-                
-            data = response.json()
-            if "response" not in data or "holidays" not in data["response"]:
-                print(f"[CALENDARIFIC] Unexpected response format for {country}")
-                continue
+            api_names, holidays, index_by_name = load_calendarific_holidays(country, HOLIDAY_API_YEAR, api_key)
             
             # Search through holidays for matching name
-            for holiday in data["response"]["holidays"]:
-                api_name = holiday["name"].lower()
-                if (event_name.lower() in api_name or 
-                    api_name in event_name.lower() or
-                    fuzz.ratio(event_name.lower(), api_name) > 85):
-                    
-                    # Parse the ISO date from the API
-                    try:
-                        iso_date = holiday["date"]["iso"]
-                        parsed_date = datetime.strptime(iso_date, "%Y-%m-%d").date()
-                        # For single-day events, return same date for start and end
-                        return (parsed_date, parsed_date)
-                    except (KeyError, ValueError) as e:
-                        print(f"[CALENDARIFIC] Date parsing error: {e}")
-                        continue
-            
-            time.sleep(1)  # Rate limiting between country requests
+            for index in match_holiday_indices(event_name_lower, api_names, index_by_name):
+                # Parse the ISO date from the API
+                try:
+                    iso_date = holidays[index]["date"]["iso"]
+                    parsed_date = date.fromisoformat(iso_date)
+                    # For single-day events, return same date for start and end
+                    return (parsed_date, parsed_date)
+                except (KeyError, ValueError) as e:
+                    print(f"[CALENDARIFIC] Date parsing error: {e}")
+                    continue
             
         except Exception as e:
             print(f"[CALENDARIFIC] Error querying API for {country}: {e}")
@@ -833,52 +936,25 @@ def fetch_from_apininjas(event_name: str, api_key: str) -> Tuple[Optional[date],
     Query the API Ninjas Holiday API to find dates for an event.
     Returns (start_date, end_date) tuple or (None, None) if not found.
     """
-    API_NINJAS_URL = "https://api.api-ninjas.com/v1/holidays"
-    
     # Try both US and Canada
     countries = ["US", "CA"]
-    year = 2025  # Current target year
+    event_name_lower = event_name.lower()
     
     for country in countries:
         try:
-            params = {
-                "country": country,
-                "year": year
-            }
-            
-            headers = {
-                'X-Api-Key': api_key,
-                'Accept': 'application/json'
-            }
-            
-            response = requests.get(API_NINJAS_URL, headers=headers, params=params, timeout=10)
-            if response.status_code != 200:
-                print(f"[API_NINJAS] API error for {country}: {response.status_code}")
-                continue
-                
-            holidays = response.json()
-            if not isinstance(holidays, list):
-                print(f"[API_NINJAS] Unexpected response format for {country}")
-                continue
+            api_names, holidays, index_by_name = load_apininjas_holidays(country, HOLIDAY_API_YEAR, api_key)
             
             # Search through holidays for matching name
-            for holiday in holidays:
-                api_name = holiday.get("name", "").lower()
-                if (event_name.lower() in api_name or 
-                    api_name in event_name.lower() or
-                    fuzz.ratio(event_name.lower(), api_name) > 85):
-                    
-                    try:
-                        date_str = holiday.get("date")
-                        if date_str:
-                            parsed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                            # For single-day events, return same date for start and end
-                            return (parsed_date, parsed_date)
-                    except ValueError as e:
-                        print(f"[API_NINJAS] Date parsing error: {e}")
-                        continue
-            
-            time.sleep(1)  # Rate limiting between country requests
+            for index in match_holiday_indices(event_name_lower, api_names, index_by_name):
+                try:
+                    date_str = holidays[index].get("date")
+                    if date_str:
+                        parsed_date = date.fromisoformat(date_str)
+                        # For single-day events, return same date for start and end
+                        return (parsed_date, parsed_date)
+                except ValueError as e:
+                    print(f"[API_NINJAS] Date parsing error: {e}")
+                    continue
             
         except Exception as e:
             print(f"[API_NINJAS] Error querying API for {country}: {e}")
@@ -892,7 +968,7 @@ def strip_parentheses(text: str) -> str:
     Remove any text within parentheses, brackets, and trailing asterisks from a string.
     Example: "Advent – Christianity [Ends December 24]" -> "Advent – Christianity"
     """
-    return re.sub(r'\(.*?\)|\[.*?\]|\*+', '', text).strip()
+    return BRACKETED_TEXT_PATTERN.sub('', text).strip()
 
 
 def scrape_the_interfaith_observer_calendar() -> Dict[str, Tuple[Optional[date], Optional[date]]]:
@@ -912,13 +988,12 @@ def scrape_the_interfaith_observer_calendar() -> Dict[str, Tuple[Optional[date],
     INTERFAITH_OBSERVER_URL = "https://www.theinterfaithobserver.org/religious-calendar"
 
     try:
-        resp = requests.get(INTERFAITH_OBSERVER_URL, headers=HEADERS, timeout=10)
-        scrape_the_interfaith_observer_calendar.response_text = resp.text  # Store response for debugging
+        resp = http_session.get(INTERFAITH_OBSERVER_URL, headers=HEADERS, timeout=10)
         if resp.status_code != 200:
             print(f"[INTERFAITH_OBSERVER] Failed to retrieve page (status {resp.status_code}).")
             return accommodations
 
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=OBSERVER_STRAINER)
         
         # Locate the Content Area within the <main> tag
         main_tag = soup.find('main', id='page')
@@ -950,7 +1025,7 @@ def scrape_the_interfaith_observer_calendar() -> Dict[str, Tuple[Optional[date],
                     month_year_text = element.get_text(separator=' ', strip=True)
                     print(f"[DEBUG] Found h2 header: '{month_year_text}'")
                     # Strict regex to match "Month Year"
-                    month_year_match = re.match(r'^([A-Za-z]+)\s+(\d{4})$', month_year_text)
+                    month_year_match = MONTH_YEAR_HEADER_PATTERN.match(month_year_text)
                     if month_year_match:
                         month_name, year_str = month_year_match.groups()
                         current_month = month_map.get(month_name)
@@ -968,7 +1043,7 @@ def scrape_the_interfaith_observer_calendar() -> Dict[str, Tuple[Optional[date],
                     date_text = element.get_text(separator=' ', strip=True)
                     print(f"[DEBUG] Found h3 header: '{date_text}'")
                     # Adjust regex to handle multiple spaces and possible extra commas
-                    date_match = re.match(r'^[A-Za-z]+,\s*([A-Za-z]+)\s+(\d{1,2})$', date_text)
+                    date_match = WEEKDAY_DATE_HEADER_PATTERN.match(date_text)
                     if date_match:
                         month_name, day_str = date_match.groups()
                         event_month = month_map.get(month_name)
@@ -1017,7 +1092,7 @@ def scrape_the_interfaith_observer_calendar() -> Dict[str, Tuple[Optional[date],
                                 end_date_text = em_tag.get_text(strip=True).strip('[]')
                                 print(f"[DEBUG] Found end date text: '{end_date_text}'")
                                 # Example: "[Ends December 24]"
-                                end_date_match = re.search(r'Ends\s+([A-Za-z]+)\s+(\d{1,2})', end_date_text, re.IGNORECASE)
+                                end_date_match = ENDS_ON_PATTERN.search(end_date_text)
                                 if end_date_match:
                                     end_month_name, end_day_str = end_date_match.groups()
                                     end_month = month_map.get(end_month_name)
@@ -1068,6 +1143,9 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
         "still_missing": 0
     }
     
+    # One timestamp for every update in this run
+    last_updated = datetime.now().replace(microsecond=0)
+    
     # Try Calendarific API first
     print("\nAttempting to update remaining events using Calendarific API...")
     calendarific_updated_events = set()
@@ -1076,9 +1154,12 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
         db_raw_name = event.get("name", "").strip()
         print(f"\nTrying Calendarific API for: '{db_raw_name}'")
         
-        # Try with main name and alternates
+        # Try with main name and alternates (the APIs match case-insensitively)
         start_dt = end_dt = None
-        for name in [db_raw_name] + event.get("alternate_names", []):
+        candidate_names = dict.fromkeys(
+            name.lower() for name in [db_raw_name] + event.get("alternate_names", [])
+        )
+        for name in candidate_names:
             start_dt, end_dt = fetch_from_calendarific(name, api_keys["calendarific"])
             if start_dt and end_dt:
                 print(f"   Found date via Calendarific: {start_dt} to {end_dt}")
@@ -1092,7 +1173,7 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
                             "$set": {
                                 "start_date": start_date,
                                 "end_date": end_date,
-                                "last_updated": datetime.now().replace(microsecond=0)
+                                "last_updated": last_updated
                             },
                             "$addToSet": {"source_urls": "https://calendarific.com/api/v2"}
                         }
@@ -1105,8 +1186,6 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
                     
                 except Exception as e:
                     print(f"   ✗ Error updating database: {e}")
-        
-        time.sleep(1)  # Rate limiting
 
     # Try API Ninjas for remaining events
     print("\nAttempting to update remaining events using API Ninjas...")
@@ -1116,9 +1195,12 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
         db_raw_name = event.get("name", "").strip()
         print(f"\nTrying API Ninjas for: '{db_raw_name}'")
         
-        # Try with main name and alternates
+        # Try with main name and alternates (the APIs match case-insensitively)
         start_dt = end_dt = None
-        for name in [db_raw_name] + event.get("alternate_names", []):
+        candidate_names = dict.fromkeys(
+            name.lower() for name in [db_raw_name] + event.get("alternate_names", [])
+        )
+        for name in candidate_names:
             start_dt, end_dt = fetch_from_apininjas(name, api_keys["apininjas"])
             if start_dt and end_dt:
                 print(f"   Found date via API Ninjas: {start_dt} to {end_dt}")
@@ -1132,7 +1214,7 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
                             "$set": {
                                 "start_date": start_date,
                                 "end_date": end_date,
-                                "last_updated": datetime.now().replace(microsecond=0)
+                                "last_updated": last_updated
                             },
                             "$addToSet": {"source_urls": "https://api.api-ninjas.com/v1/holidays"}
                         }
@@ -1144,8 +1226,6 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
                     
                 except Exception as e:
                     print(f"   ✗ Error updating database: {e}")
-        
-        time.sleep(1)  # Rate limiting
     
     # Calculate remaining missing events
     results["still_missing"] = len(remaining_events) - results["calendarific_updated"] - results["apininjas_updated"]
@@ -1153,27 +1233,53 @@ def update_remaining_events(remaining_events: List[Dict], api_keys: Dict[str, st
     return results
 
 
+UPDATE_BATCH_SIZE = 100  # Queued updates written per bulk_write
+
+
+def flush_updates(operations: List[UpdateOne], operation_names: List[str]) -> int:
+    """
+    Send the queued updates in one unordered bulk write and clear the queue.
+    Returns the number of updates that were written.
+    """
+    if not operations:
+        return 0
+    try:
+        events_collection.bulk_write(operations, ordered=False)
+        written = len(operations)
+    except BulkWriteError as e:
+        write_errors = e.details.get("writeErrors", [])
+        for error in write_errors:
+            print(f"   ✗ Error updating DB for '{operation_names[error['index']]}': {error.get('errmsg')}")
+        written = len(operations) - len(write_errors)
+    except Exception as e:
+        print(f"   ✗ Error updating DB: {e}")
+        written = 0
+    operations.clear()
+    operation_names.clear()
+    return written
+
+
 def update_event_dates(api_keys: Dict[str, str]):
     """
     Update event dates in the database from multiple sources including APIs.
     """
-    print("Scraping data from York University (primary)...")
-    york_dict = scrape_york_accommodations()
-
-    print("\nScraping data from Canada.ca...")
-    canada_dict = scrape_canada_commemorative()
-    
-    print("\nScraping data from Ontario.ca...")
-    ontario_dict = scrape_ontario_commemorative()
-    
-    print("\nScraping data from Xavier University...")
-    xavier_dict = scrape_xavier_calendar()
-    
-    print("\nScraping data from Interfaith Calendar...")
-    interfaith_dict = scrape_interfaith_calendar()
-    
-    print("\nScraping data from The Interfaith Observer...")
-    interfaith_observer_dict = scrape_the_interfaith_observer_calendar()
+    # The sources are independent pages, so fetch and parse them concurrently
+    print("Scraping data from York University (primary), Canada.ca, Ontario.ca, "
+          "Xavier University, Interfaith Calendar and The Interfaith Observer...")
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        york_future = executor.submit(scrape_york_accommodations)
+        canada_future = executor.submit(scrape_canada_commemorative)
+        ontario_future = executor.submit(scrape_ontario_commemorative)
+        xavier_future = executor.submit(scrape_xavier_calendar)
+        interfaith_future = executor.submit(scrape_interfaith_calendar)
+        interfaith_observer_future = executor.submit(scrape_the_interfaith_observer_calendar)
+
+    york_dict = york_future.result()
+    canada_dict = canada_future.result()
+    ontario_dict = ontario_future.result()
+    xavier_dict = xavier_future.result()
+    interfaith_dict = interfaith_future.result()
+    interfaith_observer_dict = interfaith_observer_future.result()
 
     print("\nStarting database update...")
 
@@ -1185,70 +1291,60 @@ def update_event_dates(api_keys: Dict[str, str]):
         "not_found": 0
     }
 
-    # Get all events from database
-    events = list(events_collection.find({}))
+    # Merge all sources into one lookup so each name is a single dict probe.
+    # Sources are listed most reliable first and applied in reverse so they win.
+    sources = [
+        (york_dict, YORK_URL, "York data"),
+        (canada_dict, CANADA_URL, "Canada.ca data"),
+        (ontario_dict, ONTARIO_URL, "Ontario.ca data"),
+        (xavier_dict, XAVIER_URL, "Xavier data"),
+        (interfaith_dict, INTERFAITH_URL, "Interfaith Calendar"),
+        (interfaith_observer_dict, INTERFAITH_OBSERVER_URL, "The Interfaith Observer"),
+    ]
+    combined_dates = {}
+    for source_dict, url, label in reversed(sources):
+        for name, dates in source_dict.items():
+            combined_dates[name] = (dates, url, label)
+
+    # Get all events from database, with only the fields used for matching
+    events = list(events_collection.find({}, {"name": 1, "alternate_names": 1}))
     not_found_events = []
 
+    # Updates are queued and sent in unordered bulk writes of UPDATE_BATCH_SIZE,
+    # all sharing one timestamp
+    operations = []
+    operation_names = []
+    last_updated = datetime.now().replace(microsecond=0)
+
     # Process each event
     for event in events:
         stats["total_events"] += 1
         db_raw_name = event.get("name", "").strip()
         alternate_names = event.get("alternate_names", [])
         
-        # Normalize possible names
-        possible_names = [strip_parentheses(db_raw_name).lower()] + [
-            strip_parentheses(name).lower() for name in alternate_names
-        ]
-        normalized_possible_names = [normalize_event_name(name) for name in possible_names]
+        # Normalize possible names, dropping duplicates while preserving order
+        possible_names = list(dict.fromkeys(
+            [strip_parentheses(db_raw_name).lower()] +
+            [strip_parentheses(name).lower() for name in alternate_names]
+        ))
 
         print(f"\nChecking DB event: '{db_raw_name}' (Possible names: {possible_names})")
 
         start_dt, end_dt = None, None
         source_url = None
 
-        # Try sources in order of reliability
-        for name in possible_names + normalized_possible_names:
-            # Try York data first (most reliable)
-            if name in york_dict:
-                start_dt, end_dt = york_dict[name]
-                source_url = YORK_URL
-                print(f"   Found in York data using name: '{name}'")
-                break
-
-            # Try Canada.ca data second
-            elif name in canada_dict:
-                start_dt, end_dt = canada_dict[name]
-                source_url = CANADA_URL
-                print(f"   Found in Canada.ca data using name: '{name}'")
-                break
-
-            # Try Ontario.ca data third
-            elif name in ontario_dict:
-                start_dt, end_dt = ontario_dict[name]
-                source_url = ONTARIO_URL
-                print(f"   Found in Ontario.ca data using name: '{name}'")
-                break
-
-            # Try Xavier data fourth
-            elif name in xavier_dict:
-                start_dt, end_dt = xavier_dict[name]
-                source_url = XAVIER_URL
-                print(f"   Found in Xavier data using name: '{name}'")
-                break
-
-            # Try Interfaith Calendar fifth
-            elif name in interfaith_dict:
-                start_dt, end_dt = interfaith_dict[name]
-                source_url = INTERFAITH_URL
-                print(f"   Found in Interfaith Calendar using name: '{name}'")
-                break
-
-            # Try The Interfaith Observer sixth
-            elif name in interfaith_observer_dict:
-                start_dt, end_dt = interfaith_observer_dict[name]
-                source_url = INTERFAITH_OBSERVER_URL
-                print(f"   Found in The Interfaith Observer using name: '{name}'")
-                break
+        # Try the names as stored first; normalize them only if none of them match
+        match = next((name for name in possible_names if name in combined_dates), None)
+        if match is None:
+            match = next(
+                (name for name in map(normalize_event_name, possible_names) if name in combined_dates),
+                None
+            )
+
+        # Sources were merged in order of reliability
+        if match is not None:
+            (start_dt, end_dt), source_url, source_label = combined_dates[match]
+            print(f"   Found in {source_label} using name: '{match}'")
 
         # If no data found from any source
         if start_dt is None and end_dt is None:
@@ -1267,39 +1363,35 @@ def update_event_dates(api_keys: Dict[str, str]):
         if not end_dt:
             end_dt = start_dt
 
-        # Update database with found dates
-        try:
-            # Store dates as datetime objects at midnight (00:00:00)
-            start_date = datetime(start_dt.year, start_dt.month, start_dt.day)
-            end_date = datetime(end_dt.year, end_dt.month, end_dt.day)
-
-            update_fields = {
-                "start_date": start_date,
-                "end_date": end_date,
-                "last_updated": datetime.now().replace(microsecond=0)
-            }
+        # Queue the database update with the found dates
+        # Store dates as datetime objects at midnight (00:00:00)
+        start_date = datetime(start_dt.year, start_dt.month, start_dt.day)
+        end_date = datetime(end_dt.year, end_dt.month, end_dt.day)
 
-            if source_url:
-                events_collection.update_one(
-                    {"_id": event["_id"]},
-                    {
-                        "$set": update_fields,
-                        "$addToSet": {"source_urls": source_url}
-                    }
-                )
-            else:
-                events_collection.update_one(
-                    {"_id": event["_id"]},
-                    {"$set": update_fields}
-                )
+        update_fields = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "last_updated": last_updated
+        }
+
+        if source_url:
+            update = {
+                "$set": update_fields,
+                "$addToSet": {"source_urls": source_url}
+            }
+        else:
+            update = {"$set": update_fields}
 
-            print(f"   ✓ Updated '{db_raw_name}' with {start_dt} to {end_dt}")
-            stats["updated_from_scraping"] += 1
+        operations.append(UpdateOne({"_id": event["_id"]}, update))
+        operation_names.append(db_raw_name)
+        print(f"   ✓ Queued update for '{db_raw_name}' with {start_dt} to {end_dt}")
 
-        except Exception as e:
-            print(f"   ✗ Error updating DB: {e}")
+        # Write full batches as the scan goes so a later failure keeps them
+        if len(operations) >= UPDATE_BATCH_SIZE:
+            stats["updated_from_scraping"] += flush_updates(operations, operation_names)
 
-        time.sleep(1)  # Rate limiting
+    # Write whatever is left of the last batch
+    stats["updated_from_scraping"] += flush_updates(operations, operation_names)
 
     # Print scraping summary
     print("\n=== SCRAPING SUMMARY ===")
@@ -1318,7 +1410,8 @@ def update_event_dates(api_keys: Dict[str, str]):
                     {"end_date": {"$exists": False}},
                     {"last_updated": {"$exists": False}}
                 ]
-            }
+            },
+            {"name": 1, "alternate_names": 1}
         ))
         
         if events_to_update:
@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
 from dotenv import load_dotenv
 import pytz
 
@@ -283,45 +284,81 @@ ALTERNATE_NAMES = {
     "Saint-Jean-Baptiste Day": ["St Jean Baptiste", "saint jean baptiste"]
 }
 
+def setup_indexes():
+    """Create the indexes used by the upsert below and by the date-range queries."""
+    try:
+        # Matches the upsert filter so each write is a single index lookup
+        events_collection.create_index([("name", ASCENDING)], unique=True)
+        # Serves the start/end date range queries sorted by start_date
+        events_collection.create_index([("start_date", ASCENDING), ("end_date", ASCENDING)])
+        print("Database indexes are in place")
+    except Exception as e:
+        print(f"✗ Error creating indexes: {e}")
+
 def initialize_events():
     """Initialize events in the database with basic information."""
     print("\nStarting event initialization...")
     
+    # Queue one upsert per event and send them all in a single bulk write
+    operations = []
+    operation_index = {}
+    
+    # Every event in the batch shares one creation timestamp
+    now = datetime.now(pytz.utc)
+    
     for category, data in EVENTS_DATA.items():
         print(f"\nProcessing category: {category}")
         
         for event_name in data["events"]:
+            # Events listed under several categories keep their first one
+            if event_name in operation_index:
+                continue
+            
             # Create the base event document
             event_doc = {
                 "name": event_name,
                 "category": category,
                 "image_url": f"/images/{event_name.lower().replace(' ', '_')}.jpg",
                 "alternate_names": ALTERNATE_NAMES.get(event_name, []),
-                "created_at": datetime.now(pytz.utc),
-                "last_updated": datetime.now(pytz.utc),
+                "created_at": now,
+                "last_updated": now,
                 "source_urls": []
             }
             
-            try:
-                # Insert the event if it doesn't exist
-                result = events_collection.update_one(
-                    {"name": event_name},
-                    {"$setOnInsert": event_doc},
-                    upsert=True
-                )
-                
-                if result.upserted_id:
-                    print(f"✓ Inserted new event: {event_name}")
-                else:
-                    print(f"• Event already exists: {event_name}")
-                    
-            except Exception as e:
-                print(f"✗ Error inserting event {event_name}: {e}")
+            # Insert the event if it doesn't exist
+            operation_index[event_name] = len(operations)
+            operations.append(UpdateOne(
+                {"name": event_name},
+                {"$setOnInsert": event_doc},
+                upsert=True
+            ))
+    
+    try:
+        result = events_collection.bulk_write(operations, ordered=False)
+        upserted_indexes = set(result.upserted_ids)
+        failed_writes = {}
+    except BulkWriteError as e:
+        # Unordered writes keep going past failures (e.g. a duplicate key
+        # from a concurrent run), so report the rest of the batch normally
+        upserted_indexes = {upsert["index"] for upsert in e.details.get("upserted", [])}
+        failed_writes = {error["index"]: error.get("errmsg") for error in e.details.get("writeErrors", [])}
+    except Exception as e:
+        print(f"✗ Error inserting events: {e}")
+        return
+    
+    for event_name, index in operation_index.items():
+        if index in failed_writes:
+            print(f"✗ Error inserting {event_name}: {failed_writes[index]}")
+        elif index in upserted_indexes:
+            print(f"✓ Inserted new event: {event_name}")
+        else:
+            print(f"• Event already exists: {event_name}")
 
 def main():
     """Main execution function."""
     try:
         print("Connected to MongoDB successfully")
+        setup_indexes()
         initialize_events()
         print("\nEvent initialization completed successfully!")
         
@@ -1,11 +1,14 @@
 import os
 import time
 import random
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 import pytz
 from dateutil import parser
-import json
+import orjson
 from urllib.parse import quote
 import google.generativeai as genai
 from selenium import webdriver
@@ -14,7 +17,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from dotenv import load_dotenv
 import re
 import unicodedata
@@ -44,6 +47,23 @@ if not GEMINI_API_KEY:
     logging.error("Missing Gemini API key in environment variables")
     exit(1)
 
+# Initialize Gemini API once; the model is shared by every request thread.
+# JSON mode makes the model return a bare JSON object instead of fenced text.
+genai.configure(api_key=GEMINI_API_KEY)
+model = genai.GenerativeModel(
+    "gemini-1.5-flash",
+    generation_config=genai.types.GenerationConfig(response_mime_type="application/json")
+)
+
+# Gemini calls run in the background while Selenium performs the next search
+MAX_CONCURRENT_REQUESTS = int(os.getenv('GEMINI_MAX_CONCURRENCY', '4'))
+
+# Updates are written to MongoDB in batches of this size as the run progresses
+UPDATE_BATCH_SIZE = 25
+
+# Upper bound on the search text sent to Gemini; knowledge panels can be very long
+MAX_SEARCH_TEXT_CHARS = 20000
+
 # Initialize MongoDB connection
 try:
     client = MongoClient(MONGO_URI)
@@ -99,6 +119,21 @@ def setup_selenium_driver(use_proxy=False):
 # Normalization Functions
 # =========================
 
+NON_ALPHANUMERIC_PATTERN = re.compile(r'[^a-z0-9\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Known synonyms replaced during normalization
+SYNONYMS = {
+    "nye": "new year's eve",
+    "valentine's": "valentines day",
+    "intl": "international",
+    "womens": "women's",
+    # Add more synonyms as needed
+}
+# All synonyms replaced in one scan; longer keys first so they win over shorter overlaps
+SYNONYM_PATTERN = re.compile('|'.join(map(re.escape, sorted(SYNONYMS, key=len, reverse=True))))
+
+@lru_cache(maxsize=4096)
 def normalize_event_name(name):
     """
     Normalize event names by:
@@ -118,24 +153,16 @@ def normalize_event_name(name):
     name = name.lower()
     
     # Replace known synonyms
-    synonyms = {
-        "nye": "new year's eve",
-        "valentine's": "valentines day",
-        "intl": "international",
-        "womens": "women's",
-        # Add more synonyms as needed
-    }
-    for key, value in synonyms.items():
-        name = name.replace(key, value)
+    name = SYNONYM_PATTERN.sub(lambda match: SYNONYMS[match.group(0)], name)
     
     # Remove special characters except spaces
-    name = re.sub(r'[^a-z0-9\s]', '', name)
+    name = NON_ALPHANUMERIC_PATTERN.sub('', name)
     
     # Normalize Unicode characters
     name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('utf-8')
     
     # Remove extra spaces
-    name = re.sub(r'\s+', ' ', name)
+    name = WHITESPACE_PATTERN.sub(' ', name)
     
     return name
 
@@ -213,7 +240,7 @@ def search_event_with_selenium(driver, event_name, alternate_names):
         
         if search_results:
             return {
-                'results': "\n".join(search_results),
+                'results': "\n".join(search_results)[:MAX_SEARCH_TEXT_CHARS],
                 'url': url
             }
         return None
@@ -222,14 +249,9 @@ def search_event_with_selenium(driver, event_name, alternate_names):
         logging.error(f"Error during search for {event_name}: {e}")
         return None
 
-def get_dates_from_gemini(event_name, search_text):
-    """Extract dates using Gemini API with improved date handling"""
-    try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        
-        prompt = f"""
-        Current datetime: {datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S %Z')}
+# Built once; only the date, event name and search results vary per call
+DATE_EXTRACTION_PROMPT = """
+        Current datetime: {current_datetime}
 
         Task: Extract the 2025 date(s) for "{event_name}" from the following search results.
 
@@ -259,11 +281,22 @@ def get_dates_from_gemini(event_name, search_text):
         Return ONLY the JSON object with the dates, no other text.
         """
 
+def get_dates_from_gemini(event_name, search_text):
+    """Extract dates using Gemini API with improved date handling"""
+    try:
+        prompt = DATE_EXTRACTION_PROMPT.format(
+            current_datetime=datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S %Z'),
+            event_name=event_name,
+            search_text=search_text
+        )
+
         response = model.generate_content(prompt)
         result = response.text.strip()
-        result = result.replace('```json', '').replace('```', '').strip()
+        # Fall back to stripping markdown fences if a reply still arrives wrapped
+        if result.startswith('```'):
+            result = result.replace('```json', '').replace('```', '').strip()
         
-        dates = json.loads(result)
+        dates = orjson.loads(result)
         
         # Validate and standardize dates
         if dates.get('start_date') or dates.get('end_date'):
@@ -295,22 +328,79 @@ def get_dates_from_gemini(event_name, search_text):
 # Update Functionality
 # =========================
 
+def queue_date_update(event, event_name, search_data, future, operations, updated_names, results):
+    """Turn one Gemini response into a queued MongoDB update"""
+    dates = future.result()
+    
+    if not (dates.get('start_date') or dates.get('end_date')):
+        logging.info(f"No valid dates found for '{event_name}'.")
+        results["failed_attempts"] += 1
+        return
+    
+    try:
+        update_dict = {
+            "last_updated": datetime.now(pytz.UTC)
+        }
+        
+        if dates.get('start_date'):
+            start_date = parser.parse(dates['start_date']).replace(tzinfo=pytz.UTC)
+            update_dict['start_date'] = start_date
+        if dates.get('end_date'):
+            end_date = parser.parse(dates['end_date']).replace(tzinfo=pytz.UTC)
+            update_dict['end_date'] = end_date
+        
+        # Update the event in MongoDB with the actual search URL
+        operations.append(UpdateOne(
+            {"_id": event["_id"]},
+            {
+                "$set": update_dict,
+                "$addToSet": {"source_urls": search_data['url']}
+            }
+        ))
+        updated_names.append(event_name)
+        
+        logging.info(f"✓ Dates for '{event_name}': {dates.get('start_date')} to {dates.get('end_date')}")
+        logging.info(f"  Source URL: {search_data['url']}")
+        
+    except Exception as e:
+        logging.error(f"Error preparing update for '{event_name}': {e}")
+        results["failed_attempts"] += 1
+
+def flush_date_updates(operations, updated_names, results):
+    """Write the queued updates in one round-trip and clear the queue"""
+    if not operations:
+        return
+    
+    try:
+        events_collection.bulk_write(operations, ordered=False)
+        results["successfully_updated"] += len(operations)
+        logging.info(f"Updated {len(operations)} events in MongoDB.")
+    except Exception as e:
+        logging.error(f"Error updating database for {', '.join(updated_names)}: {e}")
+        results["failed_attempts"] += len(operations)
+    
+    operations.clear()
+    updated_names.clear()
+
 def update_missing_dates():
     """Update only events that are missing both start_date and end_date"""
     logging.info("Fetching events missing dates...")
     
     # Define the query to find events missing start_date or end_date
+    # (an equality match on None also matches documents where the field is absent)
     missing_dates_query = {
         "$or": [
-            {"start_date": {"$exists": False}},
-            {"end_date": {"$exists": False}},
             {"start_date": None},
             {"end_date": None}
         ]
     }
     
     try:
-        missing_events = list(events_collection.find(missing_dates_query))
+        # Only the names are needed to search; _id is returned for the update
+        missing_events = list(events_collection.find(
+            missing_dates_query,
+            {"name": 1, "alternate_names": 1}
+        ))
         logging.info(f"Found {len(missing_events)} events missing dates.")
     except Exception as e:
         logging.error(f"Error querying MongoDB for missing dates: {e}")
@@ -329,71 +419,57 @@ def update_missing_dates():
     # Setup Chrome driver with optional proxy support
     driver = setup_selenium_driver(use_proxy=bool(os.getenv('PROXY_ADDRESS')))
     
+    # (event, normalized name, search data, future for the Gemini response)
+    pending = deque()
+    operations = []
+    updated_names = []
+    
     try:
-        for event in missing_events:
-            raw_event_name = event.get("name", "")
-            event_name = normalize_event_name(raw_event_name)
-            alternate_names = event.get("alternate_names", [])
-            alternate_names = [normalize_event_name(name) for name in alternate_names]
-            
-            if not event_name:
-                logging.warning(f"Event with ID {event.get('_id')} has no name after normalization. Skipping.")
-                results["failed_attempts"] += 1
-                continue
-            
-            logging.info(f"Processing: '{event_name}'")
-            
-            # Search Google using Selenium
-            search_data = search_event_with_selenium(driver, event_name, alternate_names)
-            if not search_data:
-                logging.info(f"No search results found for '{event_name}'.")
-                results["failed_attempts"] += 1
-                continue
-            
-            # Get dates from Gemini
-            dates = get_dates_from_gemini(event_name, search_data['results'])
-            
-            if dates.get('start_date') or dates.get('end_date'):
-                try:
-                    update_dict = {
-                        "last_updated": datetime.now(pytz.UTC)
-                    }
-                    
-                    if dates.get('start_date'):
-                        start_date = parser.parse(dates['start_date']).replace(tzinfo=pytz.UTC)
-                        update_dict['start_date'] = start_date
-                    if dates.get('end_date'):
-                        end_date = parser.parse(dates['end_date']).replace(tzinfo=pytz.UTC)
-                        update_dict['end_date'] = end_date
-                    
-                    # Update the event in MongoDB with the actual search URL
-                    events_collection.update_one(
-                        {"_id": event["_id"]},
-                        {
-                            "$set": update_dict,
-                            "$addToSet": {"source_urls": search_data['url']}
-                        }
-                    )
-                    
-                    logging.info(f"✓ Updated '{event_name}': {dates['start_date']} to {dates['end_date']}")
-                    logging.info(f"  Source URL: {search_data['url']}")
-                    results["successfully_updated"] += 1
-                    
-                except Exception as e:
-                    logging.error(f"Error updating database for '{event_name}': {e}")
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            for event in missing_events:
+                raw_event_name = event.get("name", "")
+                event_name = normalize_event_name(raw_event_name)
+                alternate_names = event.get("alternate_names", [])
+                alternate_names = [normalize_event_name(name) for name in alternate_names]
+                
+                if not event_name:
+                    logging.warning(f"Event with ID {event.get('_id')} has no name after normalization. Skipping.")
                     results["failed_attempts"] += 1
-            else:
-                logging.info(f"No valid dates found for '{event_name}'.")
-                results["failed_attempts"] += 1
-            
-            # Randomized delay to prevent detection
-            delay = random.uniform(2, 5)
-            logging.debug(f"Sleeping for {delay:.2f} seconds before next request.")
-            time.sleep(delay)
+                    continue
+                
+                logging.info(f"Processing: '{event_name}'")
+                
+                # Search Google using Selenium
+                search_data = search_event_with_selenium(driver, event_name, alternate_names)
+                if not search_data:
+                    logging.info(f"No search results found for '{event_name}'.")
+                    results["failed_attempts"] += 1
+                    continue
+                
+                # Ask Gemini for the dates without blocking the next search
+                future = executor.submit(get_dates_from_gemini, event_name, search_data['results'])
+                pending.append((event, event_name, search_data, future))
+                
+                # Queue the responses that are already back and write them in batches,
+                # so a failure later in the run does not lose them
+                while pending and pending[0][3].done():
+                    queue_date_update(*pending.popleft(), operations, updated_names, results)
+                if len(operations) >= UPDATE_BATCH_SIZE:
+                    flush_date_updates(operations, updated_names, results)
+                
+                # Randomized delay to prevent detection
+                delay = random.uniform(2, 5)
+                logging.debug(f"Sleeping for {delay:.2f} seconds before next request.")
+                time.sleep(delay)
             
     finally:
         driver.quit()
         logging.info("Selenium WebDriver closed.")
+        
+        # Write everything gathered so far, even if the search loop failed
+        while pending:
+            queue_date_update(*pending.popleft(), operations, updated_names, results)
+        flush_date_updates(operations, updated_names, results)
     
     # Log final results
     success_rate = (results["successfully_updated"] / results["total_attempted"] * 100) if results["total_attempted"] else 0